@@ -528,6 +528,11 @@ MQTT_TIMEOUT = config('MQTT_TIMEOUT', default=10, cast=int)
 MQTT_USERNAME = config('MQTT_USERNAME', default='futurefish_backend')
 MQTT_PASSWORD = config('MQTT_PASSWORD', default='7-33@98:epY}')
 MQTT_USE_TLS = config('MQTT_USE_TLS', default=False, cast=bool)
+# Batch Redis bridge publishes over this many milliseconds (0 publishes immediately).
+# Batched messages are at-most-once: they sit in an in-process queue, a failed
+# flush drops them, and anything still queued when a process is killed or exits
+# via os._exit (e.g. a Celery prefork child) is lost. Normal exits flush the queue.
+MQTT_BRIDGE_BATCH_MS = config('MQTT_BRIDGE_BATCH_MS', default=0, cast=int)
 
 # Device Command Settings
 DEVICE_COMMAND_TIMEOUT_SECONDS = config('DEVICE_COMMAND_TIMEOUT_SECONDS', default=10, cast=int)
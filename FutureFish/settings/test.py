@@ -0,0 +1,75 @@
+# Test settings for FutureFish
+# Development settings with a throwaway in-memory database, so the suite
+# runs the same way under `manage.py test` and pytest
+import atexit
+import os
+import shutil
+import tempfile
+
+from .dev import *  # noqa: F401,F403
+
+# In-memory SQLite: fast schema creation and no disk I/O per query.
+# None of the tests rely on PostgreSQL-specific SQL. Set USE_FAST_TESTDB=0
+# (with DATABASE_URL) to run against PostgreSQL when checking DB-specific
+# behaviour.
+if config('USE_FAST_TESTDB', default=True, cast=bool):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+else:
+    import dj_database_url
+
+    DATABASES = {
+        'default': dj_database_url.config(default=config('DATABASE_URL')),
+    }
+
+# Throwaway media directory, so files the tests save (e.g. generated QR codes)
+# never land in the real media directory
+MEDIA_ROOT = tempfile.mkdtemp(prefix='futurefish-test-media-')
+os.makedirs(os.path.join(MEDIA_ROOT, 'qr_generator', 'uploads'), exist_ok=True)
+os.makedirs(os.path.join(MEDIA_ROOT, 'qr_generator', 'qr_codes'), exist_ok=True)
+atexit.register(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
+
+# Fast hasher: PBKDF2 dominates the runtime of tests that create users or
+# log in. Hashing and verification both go through this hasher, so login
+# behaviour is unchanged.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# The test runner already forces DEBUG off at runtime, but dev.py makes
+# DEBUG-dependent choices at import time: it adds BrokenLinkEmailsMiddleware
+# and logs every SQL query whenever queries are captured, e.g. under
+# assertNumQueries. Undo both for the suite.
+DEBUG = False
+MIDDLEWARE = [
+    m for m in MIDDLEWARE
+    if m != 'django.middleware.common.BrokenLinkEmailsMiddleware'
+]
+
+
+def _without_file_handler(logger_config):
+    """Copy of a logger config that no longer writes to logs/django.log"""
+    return {
+        **logger_config,
+        'handlers': [h for h in logger_config.get('handlers', []) if h != 'file'],
+    }
+
+
+# Log to the console only: test runs must not append to logs/django.log
+LOGGING = {
+    **LOGGING,
+    'handlers': {
+        name: handler for name, handler in LOGGING['handlers'].items()
+        if name != 'file'
+    },
+    'root': _without_file_handler(LOGGING['root']),
+    'loggers': {
+        name: _without_file_handler(logger_config)
+        for name, logger_config in LOGGING['loggers'].items()
+    },
+}
+LOGGING['loggers']['django.db.backends']['level'] = 'WARNING'
@@ -1,8 +1,10 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 from django.db.models import Avg, Max, Min, Count, Sum, StdDev
 from datetime import timedelta
+from unittest.mock import patch
 from ponds.models import Pond, PondPair, SensorData
 from automation.models import DeviceCommand
 from django.db.models.functions import TruncDate
@@ -645,12 +647,14 @@ from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.test.utils import override_settings
+from analytics.views import HistoricalDataView
 
 
 @override_settings(DEBUG=True)
 class AnalyticsViewsTest(APITestCase):
     def setUp(self):
-        # Clean up any existing data first
+        # Clean up any existing data first, including cached view responses
+        cache.clear()
         SensorData.objects.all().delete()
         Pond.objects.all().delete()
         PondPair.objects.all().delete()
@@ -685,25 +689,25 @@ class AnalyticsViewsTest(APITestCase):
         # Start from 24 hours ago (to ensure data is within the 24h range)
         start_time = self.now - timedelta(hours=24)
         
-        # Create data for exactly 24 hours, including the current hour
+        # Create data for exactly 24 hours, including the current hour.
+        # One reading per hour is enough to produce every hourly bucket;
+        # test_aggregation_accuracy seeds its own multi-reading hour.
         for hour in range(24):
             hour_time = start_time + timedelta(hours=hour)
             
-            # Create three readings per hour
-            for minute in [0, 20, 40]:
-                # Create the record, which will get the auto_now_add timestamp
-                sensor = SensorData.objects.create(
-                    pond=self.pond,
-                    temperature=25.0 + hour * 0.1,  # Vary temperature slightly
-                    water_level=80.0 + hour * 0.5,  # Vary water level slightly
-                    turbidity=10.0 + hour * 0.2,    # Vary turbidity slightly
-                    dissolved_oxygen=7.0 + hour * 0.05,  # Vary DO slightly
-                    ph=7.2 + hour * 0.01,           # Vary pH slightly
-                    feed_level=90.0 - hour * 0.3,   # Vary feed level slightly
-                )
-                # Override the auto-added timestamp with the desired value
-                sensor.timestamp = hour_time + timedelta(minutes=minute)
-                sensor.save(update_fields=['timestamp'])
+            # Create the record, which will get the auto_now_add timestamp
+            sensor = SensorData.objects.create(
+                pond=self.pond,
+                temperature=25.0 + hour * 0.1,  # Vary temperature slightly
+                water_level=80.0 + hour * 0.5,  # Vary water level slightly
+                turbidity=10.0 + hour * 0.2,    # Vary turbidity slightly
+                dissolved_oxygen=7.0 + hour * 0.05,  # Vary DO slightly
+                ph=7.2 + hour * 0.01,           # Vary pH slightly
+                feed_level=90.0 - hour * 0.3,   # Vary feed level slightly
+            )
+            # Override the auto-added timestamp with the desired value
+            sensor.timestamp = hour_time
+            sensor.save(update_fields=['timestamp'])
 
     def test_current_data_authenticated(self):
         """Test current data endpoint with authentication"""
@@ -807,12 +811,9 @@ class AnalyticsViewsTest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Find the relevant hour in response
-        test_data = next(
-            (d for d in response.data['historical_data'] 
-             if d['timestamp'].startswith(test_hour.strftime('%Y-%m-%dT%H'))),
-            None
-        )
+        # Index the response by hour ('YYYY-MM-DDTHH') and look up the test hour
+        by_hour = {d['timestamp'][:13]: d for d in response.data['historical_data']}
+        test_data = by_hour.get(test_hour.strftime('%Y-%m-%dT%H'))
         
         self.assertIsNotNone(test_data, "Could not find test hour in response data")
         self.assertAlmostEqual(test_data['temperature'], expected_avg, places=2)
@@ -830,3 +831,63 @@ class AnalyticsViewsTest(APITestCase):
         }
         
         self.assertEqual(set(data_point.keys()), expected_fields)
+
+
+class HistoricalDataCacheTest(APITestCase):
+    """HistoricalDataView serves one cached response per timeframe bucket"""
+    
+    def setUp(self):
+        cache.clear()
+        
+        self.user = User.objects.create_user(username='cacheuser', password='testpass123')
+        self.pond_pair = PondPair.objects.create(
+            name='Cache Pair',
+            device_id='AA:BB:CC:DD:EE:01',
+            owner=self.user
+        )
+        self.pond = Pond.objects.create(
+            name='Cache Pond',
+            parent_pair=self.pond_pair,
+            sensor_height=100,
+            tank_depth=80
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('analytics:historical_data', kwargs={'pond_id': self.pond.id})
+        
+        # Mid-hour, so the 24h timeframe's hourly bucket has time left
+        self.now = timezone.now().replace(minute=30, second=1, microsecond=0)
+        self.add_reading(temperature=20.0)
+
+    def add_reading(self, temperature):
+        sensor = SensorData.objects.create(
+            pond=self.pond, pond_pair=self.pond_pair, temperature=temperature
+        )
+        sensor.timestamp = self.now - timedelta(minutes=1)
+        sensor.save(update_fields=['timestamp'])
+
+    def get_latest_hour_temperature(self, at):
+        with patch('django.utils.timezone.now', return_value=at):
+            response = self.client.get(f'{self.url}?timeframe=24h')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['data'][-1]['temperature']
+
+    def test_reading_within_bucket_is_served_from_cache(self):
+        self.assertEqual(self.get_latest_hour_temperature(self.now), 20.0)
+        
+        self.add_reading(temperature=30.0)
+        
+        # Same bucket: the cached response is returned without recomputing
+        with self.assertNumQueries(1):  # Ownership check only
+            temperature = self.get_latest_hour_temperature(self.now + timedelta(minutes=20))
+        self.assertEqual(temperature, 20.0)
+
+    def test_next_bucket_recomputes(self):
+        self.assertEqual(self.get_latest_hour_temperature(self.now), 20.0)
+        
+        self.add_reading(temperature=30.0)
+        
+        # First instant of the next bucket; the latest full hour holds both readings
+        bucket_seconds = HistoricalDataView.TIMEFRAMES['24h']['bucket_seconds']
+        seconds_left = bucket_seconds - self.now.timestamp() % bucket_seconds
+        next_bucket = self.now + timedelta(seconds=seconds_left)
+        self.assertEqual(self.get_latest_hour_temperature(next_bucket), 25.0)
@@ -1,7 +1,8 @@
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from datetime import timedelta, datetime
-from django.db.models import Avg
+from django.db.models import Avg, Case, Value, When
+from django.db.models.functions import ExtractHour, TruncDate, TruncHour
 from django.db import models
 from django.core.cache import cache
 from rest_framework import status
@@ -42,8 +43,8 @@ class PondFeedMultiStatsView(APIView):
     
     def get(self, request, pond_id):
         # Verify the pond exists and the user is the owner
-        pond = get_object_or_404(Pond, id=pond_id)
-        if request.user != pond.parent_pair.owner:
+        pond = get_object_or_404(Pond.objects.select_related('parent_pair'), id=pond_id)
+        if pond.parent_pair.owner_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to access this pond's data."},
                 status=status.HTTP_403_FORBIDDEN
@@ -176,8 +177,8 @@ class PondFeedStatsView(APIView):
             )
         
         # Verify the pond exists and the user is the owner
-        pond = get_object_or_404(Pond, id=pond_id)
-        if request.user != pond.parent_pair.owner:
+        pond = get_object_or_404(Pond.objects.select_related('parent_pair'), id=pond_id)
+        if pond.parent_pair.owner_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to access this pond's data."},
                 status=status.HTTP_403_FORBIDDEN
@@ -312,8 +313,8 @@ class PondFeedHistoryView(APIView):
             )
         
         # Verify the pond exists and the user is the owner
-        pond = get_object_or_404(Pond, id=pond_id)
-        if request.user != pond.parent_pair.owner:
+        pond = get_object_or_404(Pond.objects.select_related('parent_pair'), id=pond_id)
+        if pond.parent_pair.owner_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to access this pond's data."},
                 status=status.HTTP_403_FORBIDDEN
@@ -421,6 +422,22 @@ class HistoricalDataView(APIView):
     """
     permission_classes = [IsAuthenticated]
     
+    # How far back each timeframe reaches, and how long one of its responses
+    # is cached. Responses are keyed on the bucket the request falls in, so
+    # each bucket computes once and the previous bucket's entry expires with it
+    TIMEFRAMES = {
+        '24h': {'lookback': timedelta(hours=24), 'bucket_seconds': 60 * 60},
+        '1w': {'lookback': timedelta(days=7), 'bucket_seconds': 6 * 60 * 60},
+        '1m': {'lookback': timedelta(days=30), 'bucket_seconds': 24 * 60 * 60},
+    }
+    
+    # 8-hour segments of a day used by the weekly/monthly timeframes
+    DAY_SEGMENTS = (
+        ('morning', 0, 8),    # 00:00-08:00
+        ('afternoon', 8, 16), # 08:00-16:00
+        ('night', 16, 24),    # 16:00-24:00 (will be handled as 23:59:59)
+    )
+    
     def get(self, request, pond_id, *args, **kwargs):
         timeframe = request.GET.get('timeframe')
         
@@ -430,47 +447,56 @@ class HistoricalDataView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        if timeframe not in ['24h', '1w', '1m']:
+        if timeframe not in self.TIMEFRAMES:
             return Response(
                 {"error": "Invalid timeframe. Use '24h', '1w', or '1m'."},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
         # Verify the pond exists and the user is the owner
-        pond = get_object_or_404(Pond, id=pond_id)
-        if request.user != pond.parent_pair.owner:
+        pond = get_object_or_404(Pond.objects.select_related('parent_pair'), id=pond_id)
+        if pond.parent_pair.owner_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to access this pond's data."},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Calculate time range based on timeframe
         now = timezone.now()
-        data = []
+        lookback = self.TIMEFRAMES[timeframe]['lookback']
+        bucket_seconds = self.TIMEFRAMES[timeframe]['bucket_seconds']
+        
+        # Create cache key for this specific query and cache bucket
+        cache_bucket = int(now.timestamp() // bucket_seconds)
+        cache_key = f"historical_data_{pond_id}_{timeframe}_{cache_bucket}"
+        
+        # Try to get from cache first
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return Response(cached_result)
+        
+        # Calculate time range based on timeframe
+        start_time = now - lookback
         
         if timeframe == '24h':
-            start_time = now - timedelta(hours=24)
             data = self._get_hourly_data(pond, start_time, now)
-        elif timeframe == '1w':
-            start_time = now - timedelta(days=7)
-            data = self._get_daily_segments_data(pond, start_time, now, 7)
-        elif timeframe == '1m':
-            start_time = now - timedelta(days=30)
-            data = self._get_daily_segments_data(pond, start_time, now, 30)
-        
-        return Response({
+        else:
+            data = self._get_daily_segments_data(pond, start_time, now, lookback.days)
+        
+        result = {
             'timeframe': timeframe,
             'pond_id': pond_id,
             'data': data
-        })
-    
-    def _get_hourly_data(self, pond, start_time, end_time):
-        """Get hourly aggregated data for 24h timeframe."""
-        data = []
+        }
+        
+        # Cache the result for the length of its bucket
+        cache.set(cache_key, result, timeout=bucket_seconds)
         
-        # Get all sensor data for the pond in the time range
+        return Response(result)
+    
+    def _get_sensor_data(self, pond, start_time, end_time):
+        """Get the pond's sensor readings in the time range that carry any value."""
         # Check both direct pond reference and pond_pair reference
-        sensor_data = SensorData.objects.filter(
+        return SensorData.objects.filter(
             models.Q(pond=pond) | models.Q(pond_pair=pond.parent_pair),
             timestamp__range=[start_time, end_time]
         ).exclude(
@@ -479,28 +505,40 @@ class HistoricalDataView(APIView):
             ph__isnull=True,
             water_level__isnull=True
         )
+    
+    def _get_bucket_averages(self, sensor_data, *bucket_fields):
+        """
+        Average the readings per bucket in a single GROUP BY query.
+        
+        Returns a dict keyed by the tuple of bucket field values; buckets
+        without readings are simply absent.
+        """
+        rows = sensor_data.values(*bucket_fields).annotate(
+            temperature=Avg('temperature'),
+            dissolved_oxygen=Avg('dissolved_oxygen'),
+            ph=Avg('ph'),
+            water_level=Avg('water_level')
+        ).order_by()  # Keep the model's default ordering out of the GROUP BY
+        
+        return {tuple(row[field] for field in bucket_fields): row for row in rows}
+    
+    def _get_hourly_data(self, pond, start_time, end_time):
+        """Get hourly aggregated data for 24h timeframe."""
+        data = []
+        
+        # Averages for every hour with readings, in one query
+        sensor_data = self._get_sensor_data(pond, start_time, end_time).annotate(
+            hour=TruncHour('timestamp', tzinfo=start_time.tzinfo)
+        )
+        averages = self._get_bucket_averages(sensor_data, 'hour')
         
-        # Group by hour and calculate averages
+        # Walk the hours so that hours without readings still get a bucket
         current_time = start_time.replace(minute=0, second=0, microsecond=0)
         
         while current_time < end_time:
-            next_hour = current_time + timedelta(hours=1)
+            avg_data = averages.get((current_time,))
             
-            # Get data for this hour
-            hour_data = sensor_data.filter(
-                timestamp__gte=current_time,
-                timestamp__lt=next_hour
-            )
-            
-            if hour_data.exists():
-                # Calculate averages for this hour
-                avg_data = hour_data.aggregate(
-                    temperature=Avg('temperature'),
-                    dissolved_oxygen=Avg('dissolved_oxygen'),
-                    ph=Avg('ph'),
-                    water_level=Avg('water_level')
-                )
-                
+            if avg_data:
                 data.append({
                     'timestamp': current_time.isoformat(),
                     'temperature': round(avg_data['temperature'] or 0, 2),
@@ -518,7 +556,7 @@ class HistoricalDataView(APIView):
                     'water_level': None
                 })
             
-            current_time = next_hour
+            current_time += timedelta(hours=1)
         
         return data
     
@@ -526,61 +564,33 @@ class HistoricalDataView(APIView):
         """Get daily segment data (morning, afternoon, night) for weekly/monthly timeframes."""
         data = []
         
-        # Get all sensor data for the pond in the time range
-        # Check both direct pond reference and pond_pair reference
-        sensor_data = SensorData.objects.filter(
-            models.Q(pond=pond) | models.Q(pond_pair=pond.parent_pair),
-            timestamp__range=[start_time, end_time]
-        ).exclude(
-            temperature__isnull=True,
-            dissolved_oxygen__isnull=True,
-            ph__isnull=True,
-            water_level__isnull=True
+        # Label each reading with its local date and day segment, then take
+        # the averages for every (date, segment) with readings in one query
+        sensor_data = self._get_sensor_data(pond, start_time, end_time).annotate(
+            local_hour=ExtractHour('timestamp')
+        ).annotate(
+            day=TruncDate('timestamp'),
+            segment=Case(
+                *[
+                    When(local_hour__lt=end_hour, then=Value(segment_name))
+                    for segment_name, _, end_hour in self.DAY_SEGMENTS[:-1]
+                ],
+                default=Value(self.DAY_SEGMENTS[-1][0])
+            )
         )
+        averages = self._get_bucket_averages(sensor_data, 'day', 'segment')
         
         current_date = start_time.date()
         end_date = end_time.date()
         
         while current_date <= end_date:
-            # Define 8-hour segments for the day
-            segments = [
-                ('morning', 0, 8),    # 00:00-08:00
-                ('afternoon', 8, 16), # 08:00-16:00
-                ('night', 16, 24)     # 16:00-24:00 (will be handled as 23:59:59)
-            ]
-            
-            for segment_name, start_hour, end_hour in segments:
-                # Create datetime objects for this segment
+            for segment_name, start_hour, _ in self.DAY_SEGMENTS:
                 segment_start = timezone.make_aware(
                     datetime.combine(current_date, datetime.min.time().replace(hour=start_hour))
                 )
+                avg_data = averages.get((current_date, segment_name))
                 
-                # Handle the 24-hour case (night segment) properly
-                if end_hour == 24:
-                    # For the night segment, end at 23:59:59 of the same day
-                    segment_end = timezone.make_aware(
-                        datetime.combine(current_date, datetime.max.time().replace(microsecond=0))
-                    )
-                else:
-                    segment_end = timezone.make_aware(
-                        datetime.combine(current_date, datetime.min.time().replace(hour=end_hour))
-                    )
-                
-                # Get data for this segment
-                segment_data = sensor_data.filter(
-                    timestamp__gte=segment_start,
-                    timestamp__lt=segment_end
-                )
-                
-                if segment_data.exists():
-                    # Calculate averages for this segment
-                    avg_data = segment_data.aggregate(
-                        temperature=Avg('temperature'),
-                        dissolved_oxygen=Avg('dissolved_oxygen'),
-                        ph=Avg('ph'),
-                        water_level=Avg('water_level')
-                    )
-                    
+                if avg_data:
                     data.append({
                         'timestamp': segment_start.isoformat(),
                         'segment': segment_name,
@@ -709,38 +709,34 @@ from datetime import time as time_class
 class AutomationScheduleViewTest(TestCase):
     """Tests for automation schedule endpoints"""
     
-    def setUp(self):
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
         # Create test user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='TestPassword123!'
         )
         
         # Create test pond pair and pond
-        self.pond_pair = PondPair.objects.create(
+        cls.pond_pair = PondPair.objects.create(
             device_id='AA:BB:CC:DD:EE:FF',
-            owner=self.user
+            owner=cls.user
         )
-        self.pond = Pond.objects.create(
+        cls.pond = Pond.objects.create(
             name='Test Pond',
-            parent_pair=self.pond_pair
+            parent_pair=cls.pond_pair,
+            sensor_height=100,
+            tank_depth=80
         )
         
-        # Login
-        response = self.client.post(reverse('users:login'), {
-            'username': 'testuser',
-            'password': 'TestPassword123!'
-        }, format='json')
-        
-        self.access_token = response.data['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
-        
-        self.schedule_url = reverse('automation:create_automation_schedule', kwargs={'pond_id': self.pond.id})
-        # print(f"DEBUG: schedule_url = {self.schedule_url}")
-        # print(f"DEBUG: pond.id = {self.pond.id}")
+        # URLs, resolved once per class
+        cls.schedule_url = reverse('automation:create_automation_schedule', kwargs={'pond_id': cls.pond.id})
+        cls.schedule_list_url = reverse('automation:pond_automation_schedule_list', kwargs={'pond_id': cls.pond.id})
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
     
     def tearDown(self):
         """Clean up after each test"""
@@ -762,11 +758,15 @@ class AutomationScheduleViewTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(AutomationSchedule.objects.count(), 1)
         
-        schedule = AutomationSchedule.objects.first()
-        self.assertEqual(schedule.pond, self.pond)
-        self.assertEqual(schedule.automation_type, 'FEED')
-        self.assertEqual(schedule.action, 'FEED')
-        self.assertEqual(schedule.feed_amount, 50.0)
+        schedule = AutomationSchedule.objects.values(
+            'pond_id', 'automation_type', 'action', 'feed_amount'
+        ).first()
+        self.assertEqual(schedule, {
+            'pond_id': self.pond.id,
+            'automation_type': 'FEED',
+            'action': 'FEED',
+            'feed_amount': 50.0,
+        })
     
     def test_invalid_schedule_data(self):
         """Test validation of schedule data"""
@@ -944,7 +944,9 @@ class AutomationScheduleViewTest(TestCase):
         )
         other_pond = Pond.objects.create(
             name='Other Pond',
-            parent_pair=other_pond_pair
+            parent_pair=other_pond_pair,
+            sensor_height=100,
+            tank_depth=80
         )
         
         data = {
@@ -966,7 +968,7 @@ class AutomationScheduleViewTest(TestCase):
     
     def test_schedule_unauthenticated(self):
         """Test that unauthenticated user cannot create schedule"""
-        self.client.credentials()  # Clear credentials
+        self.client.force_authenticate(user=None)
         
         data = {
             'pond_id': self.pond.id,
@@ -1006,8 +1008,10 @@ class AutomationScheduleViewTest(TestCase):
             user=self.user
         )
         
-        list_url = reverse('automation:pond_automation_schedule_list', kwargs={'pond_id': self.pond.id})
-        response = self.client.get(list_url)
+        # Two queries: the pond with its pair for the ownership check, and the
+        # schedules. force_authenticate means there is no JWT user lookup
+        with self.assertNumQueries(2):
+            response = self.client.get(self.schedule_list_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['data']), 2)
@@ -1040,9 +1044,10 @@ class AutomationScheduleViewTest(TestCase):
         self.assertEqual(response.data['schedule']['feed_amount'], 75.0)
         
         # Verify in database
-        schedule.refresh_from_db()
-        self.assertEqual(schedule.time, time_class(9, 0))
-        self.assertEqual(schedule.feed_amount, 75.0)
+        self.assertEqual(
+            AutomationSchedule.objects.values_list('time', 'feed_amount').get(pk=schedule.pk),
+            (time_class(9, 0), 75.0)
+        )
     
     def test_delete_schedule(self):
         """Test deleting an automation schedule"""
@@ -16,7 +16,7 @@ from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import OuterRef, Q, Subquery
 import json
 import time
 from django.utils import timezone
@@ -266,37 +266,30 @@ class GetAutomationSchedulesView(APIView):
     
     def get(self, request, pond_id):
         try:
-            pond = get_object_or_404(Pond, id=pond_id)
+            pond = get_object_or_404(Pond.objects.select_related('parent_pair'), id=pond_id)
             
             # Check if user has access to this pond
-            if pond.parent_pair.owner != request.user:
+            if pond.parent_pair.owner_id != request.user.id:
                 return Response({
                     'success': False,
                     'error': 'Access denied'
                 }, status=status.HTTP_403_FORBIDDEN)
             
-            schedules = AutomationSchedule.objects.filter(pond=pond).order_by('priority', 'time')
+            schedules = AutomationSchedule.objects.filter(pond=pond).order_by('priority', 'time').values(
+                'id', 'automation_type', 'action', 'time', 'days', 'is_active', 'priority',
+                'feed_amount', 'drain_water_level', 'target_water_level', 'last_execution',
+                'next_execution', 'execution_count', 'created_at', 'updated_at'
+            )
             
-            # Serialize schedules
+            # Serialize schedules, formatting the time and timestamp columns
             schedule_data = []
             for schedule in schedules:
-                schedule_data.append({
-                    'id': schedule.id,
-                    'automation_type': schedule.automation_type,
-                    'action': schedule.action,
-                    'time': schedule.time.strftime('%H:%M'),
-                    'days': schedule.days,
-                    'is_active': schedule.is_active,
-                    'priority': schedule.priority,
-                    'feed_amount': schedule.feed_amount,
-                    'drain_water_level': schedule.drain_water_level,
-                    'target_water_level': schedule.target_water_level,
-                    'last_execution': schedule.last_execution.isoformat() if schedule.last_execution else None,
-                    'next_execution': schedule.next_execution.isoformat() if schedule.next_execution else None,
-                    'execution_count': schedule.execution_count,
-                    'created_at': schedule.created_at.isoformat(),
-                    'updated_at': schedule.updated_at.isoformat(),
-                })
+                schedule['time'] = schedule['time'].strftime('%H:%M')
+                schedule['last_execution'] = schedule['last_execution'].isoformat() if schedule['last_execution'] else None
+                schedule['next_execution'] = schedule['next_execution'].isoformat() if schedule['next_execution'] else None
+                schedule['created_at'] = schedule['created_at'].isoformat()
+                schedule['updated_at'] = schedule['updated_at'].isoformat()
+                schedule_data.append(schedule)
             
             return Response({
                 'success': True,
@@ -379,10 +372,12 @@ class UpdateAutomationScheduleView(generics.GenericAPIView):
     def get(self, request, pond_id, schedule_id):
         """Retrieve a specific automation schedule"""
         try:
-            schedule = get_object_or_404(AutomationSchedule, id=schedule_id)
+            schedule = get_object_or_404(
+                AutomationSchedule.objects.select_related('pond__parent_pair'), id=schedule_id
+            )
             
             # Check if user has access to this schedule
-            if schedule.pond.parent_pair.owner != request.user:
+            if schedule.pond.parent_pair.owner_id != request.user.id:
                 return Response(
                     {'error': 'Access denied'},
                     status=status.HTTP_403_FORBIDDEN
@@ -420,10 +415,12 @@ class UpdateAutomationScheduleView(generics.GenericAPIView):
     def put(self, request, pond_id, schedule_id):
         """Update an automation schedule (full update)"""
         try:
-            schedule = get_object_or_404(AutomationSchedule, id=schedule_id)
+            schedule = get_object_or_404(
+                AutomationSchedule.objects.select_related('pond__parent_pair'), id=schedule_id
+            )
             
             # Check if user has access to this schedule
-            if schedule.pond.parent_pair.owner != request.user:
+            if schedule.pond.parent_pair.owner_id != request.user.id:
                 return Response(
                     {'error': 'Access denied'},
                     status=status.HTTP_403_FORBIDDEN
@@ -514,10 +511,12 @@ class UpdateAutomationScheduleView(generics.GenericAPIView):
     def patch(self, request, pond_id, schedule_id):
         """Update an automation schedule"""
         try:
-            schedule = get_object_or_404(AutomationSchedule, id=schedule_id)
+            schedule = get_object_or_404(
+                AutomationSchedule.objects.select_related('pond__parent_pair'), id=schedule_id
+            )
             
             # Check if user has access to this schedule
-            if schedule.pond.parent_pair.owner != request.user:
+            if schedule.pond.parent_pair.owner_id != request.user.id:
                 return Response(
                     {'error': 'Access denied'},
                     status=status.HTTP_403_FORBIDDEN
@@ -617,10 +616,12 @@ class DeleteAutomationScheduleView(generics.DestroyAPIView):
     def delete(self, request, pond_id, schedule_id):
         """Delete an automation schedule"""
         try:
-            schedule = get_object_or_404(AutomationSchedule, id=schedule_id)
+            schedule = get_object_or_404(
+                AutomationSchedule.objects.select_related('pond__parent_pair'), id=schedule_id
+            )
             
             # Check if user has access to this schedule
-            if schedule.pond.parent_pair.owner != request.user:
+            if schedule.pond.parent_pair.owner_id != request.user.id:
                 return Response(
                     {'error': 'Access denied'},
                     status=status.HTTP_403_FORBIDDEN
@@ -851,10 +852,12 @@ class UpdateAutomationScheduleFunctionView(APIView):
     
     def put(self, request, schedule_id):
         try:
-            schedule = get_object_or_404(AutomationSchedule, id=schedule_id)
+            schedule = get_object_or_404(
+                AutomationSchedule.objects.select_related('pond__parent_pair'), id=schedule_id
+            )
             
             # Check if user has access to this schedule
-            if schedule.pond.parent_pair.owner != request.user:
+            if schedule.pond.parent_pair.owner_id != request.user.id:
                 return Response({
                     'success': False,
                     'error': 'Access denied'
@@ -949,10 +952,12 @@ class DeleteAutomationScheduleFunctionView(APIView):
     
     def delete(self, request, schedule_id):
         try:
-            schedule = get_object_or_404(AutomationSchedule, id=schedule_id)
+            schedule = get_object_or_404(
+                AutomationSchedule.objects.select_related('pond__parent_pair'), id=schedule_id
+            )
             
             # Check if user has access to this schedule
-            if schedule.pond.parent_pair.owner != request.user:
+            if schedule.pond.parent_pair.owner_id != request.user.id:
                 return Response({
                     'success': False,
                     'error': 'Access denied'
@@ -2442,30 +2447,39 @@ class UnifiedDashboardStreamView(View):
                     
                     # Get initial data
                     try:
-                        pond_pair = PondPair.objects.get(ponds__id=pond_id)
+                        # Fetch the pond pair with its device status and the latest
+                        # non-null value of each sensor parameter in one query
+                        sensor_fields = (
+                            'temperature', 'water_level', 'water_level2', 'feed_level',
+                            'feed_level2', 'turbidity', 'dissolved_oxygen', 'ph',
+                            'ammonia', 'battery', 'signal_strength'
+                        )
+                        pond_pair = PondPair.objects.select_related('device_status').annotate(
+                            **{
+                                f'latest_{field_name}': Subquery(
+                                    SensorData.objects.filter(
+                                        pond_pair=OuterRef('pk'),
+                                        **{f'{field_name}__isnull': False}
+                                    ).order_by('-timestamp').values(field_name)[:1]
+                                )
+                                for field_name in sensor_fields
+                            }
+                        ).get(ponds__id=pond_id)
                         initial_device_status = pond_pair.device_status
                         device_id = pond_pair.device_id  # Get device ID for channel subscription
                         
-                        # Get latest non-null data for each sensor parameter
-                        def get_latest_non_null_data(pond_pair, field_name):
-                            """Get the latest non-null value for a specific sensor field"""
-                            return SensorData.objects.filter(
-                                pond_pair=pond_pair,
-                                **{f'{field_name}__isnull': False}
-                            ).order_by('-timestamp').first()
-                        
-                        # Get latest non-null values for each parameter
-                        latest_temperature = get_latest_non_null_data(pond_pair, 'temperature')
-                        latest_water_level = get_latest_non_null_data(pond_pair, 'water_level')
-                        latest_water_level2 = get_latest_non_null_data(pond_pair, 'water_level2')
-                        latest_feed_level = get_latest_non_null_data(pond_pair, 'feed_level')
-                        latest_feed_level2 = get_latest_non_null_data(pond_pair, 'feed_level2')
-                        latest_turbidity = get_latest_non_null_data(pond_pair, 'turbidity')
-                        latest_dissolved_oxygen = get_latest_non_null_data(pond_pair, 'dissolved_oxygen')
-                        latest_ph = get_latest_non_null_data(pond_pair, 'ph')
-                        latest_ammonia = get_latest_non_null_data(pond_pair, 'ammonia')
-                        latest_battery = get_latest_non_null_data(pond_pair, 'battery')
-                        latest_signal_strength = get_latest_non_null_data(pond_pair, 'signal_strength')
+                        # Latest non-null values for each parameter
+                        latest_temperature = pond_pair.latest_temperature
+                        latest_water_level = pond_pair.latest_water_level
+                        latest_water_level2 = pond_pair.latest_water_level2
+                        latest_feed_level = pond_pair.latest_feed_level
+                        latest_feed_level2 = pond_pair.latest_feed_level2
+                        latest_turbidity = pond_pair.latest_turbidity
+                        latest_dissolved_oxygen = pond_pair.latest_dissolved_oxygen
+                        latest_ph = pond_pair.latest_ph
+                        latest_ammonia = pond_pair.latest_ammonia
+                        latest_battery = pond_pair.latest_battery
+                        latest_signal_strength = pond_pair.latest_signal_strength
                         
                         # Get the most recent record for timestamp and device info
                         initial_sensor_data = SensorData.objects.filter(
@@ -2476,7 +2490,7 @@ class UnifiedDashboardStreamView(View):
                         active_commands = DeviceCommand.objects.filter(
                             pond__in=pond_pair.ponds.all(),
                             status__in=['PENDING', 'SENT', 'ACKNOWLEDGED', 'EXECUTING']
-                        ).order_by('-created_at')[:10]
+                        ).select_related('pond').order_by('-created_at')[:10]
                         
                         # Get recent alerts for this pond
                         recent_alerts = Alert.objects.filter(
@@ -2526,10 +2540,10 @@ class UnifiedDashboardStreamView(View):
                         }
                         
                         # Device-level data using latest non-null values
-                        if latest_battery:
-                            comprehensive_data['battery'] = latest_battery.battery
-                        if latest_signal_strength:
-                            comprehensive_data['signal_strength'] = latest_signal_strength.signal_strength
+                        if latest_battery is not None:
+                            comprehensive_data['battery'] = latest_battery
+                        if latest_signal_strength is not None:
+                            comprehensive_data['signal_strength'] = latest_signal_strength
                         if initial_sensor_data and initial_sensor_data.device_timestamp:
                             comprehensive_data['device_timestamp'] = initial_sensor_data.device_timestamp.isoformat()
                         
@@ -2545,28 +2559,28 @@ class UnifiedDashboardStreamView(View):
                             
                             # Add device-level data to each pond (same values for both ponds)
                             # Use latest non-null values for each parameter
-                            if latest_temperature:
-                                comprehensive_data[pond_key]['temperature'] = latest_temperature.temperature
-                            if latest_dissolved_oxygen:
-                                comprehensive_data[pond_key]['dissolved_oxygen'] = latest_dissolved_oxygen.dissolved_oxygen
-                            if latest_ph:
-                                comprehensive_data[pond_key]['ph'] = latest_ph.ph
-                            if latest_turbidity:
-                                comprehensive_data[pond_key]['turbidity'] = latest_turbidity.turbidity
-                            if latest_ammonia:
-                                comprehensive_data[pond_key]['ammonia'] = latest_ammonia.ammonia
+                            if latest_temperature is not None:
+                                comprehensive_data[pond_key]['temperature'] = latest_temperature
+                            if latest_dissolved_oxygen is not None:
+                                comprehensive_data[pond_key]['dissolved_oxygen'] = latest_dissolved_oxygen
+                            if latest_ph is not None:
+                                comprehensive_data[pond_key]['ph'] = latest_ph
+                            if latest_turbidity is not None:
+                                comprehensive_data[pond_key]['turbidity'] = latest_turbidity
+                            if latest_ammonia is not None:
+                                comprehensive_data[pond_key]['ammonia'] = latest_ammonia
                             
                             # Add pond-specific readings using latest non-null values
                             if pond_number == 1:
-                                if latest_water_level:
-                                    comprehensive_data[pond_key]['water_level'] = latest_water_level.water_level
-                                if latest_feed_level:
-                                    comprehensive_data[pond_key]['feed_level'] = latest_feed_level.feed_level
+                                if latest_water_level is not None:
+                                    comprehensive_data[pond_key]['water_level'] = latest_water_level
+                                if latest_feed_level is not None:
+                                    comprehensive_data[pond_key]['feed_level'] = latest_feed_level
                             else:
-                                if latest_water_level2:
-                                    comprehensive_data[pond_key]['water_level'] = latest_water_level2.water_level2
-                                if latest_feed_level2:
-                                    comprehensive_data[pond_key]['feed_level'] = latest_feed_level2.feed_level2
+                                if latest_water_level2 is not None:
+                                    comprehensive_data[pond_key]['water_level'] = latest_water_level2
+                                if latest_feed_level2 is not None:
+                                    comprehensive_data[pond_key]['feed_level'] = latest_feed_level2
                         
                         sensor_data = {
                             'type': 'sensor_data',
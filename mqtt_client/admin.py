@@ -2,10 +2,22 @@ from django.contrib import admin
 from .models import DeviceStatus, MQTTMessage
 
 
+class PondPairListFilter(admin.RelatedFieldListFilter):
+    """Pond pair filter that loads each pair's owner for its label in the same query"""
+    
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        pond_pairs = field.related_model._default_manager.select_related('owner')
+        if ordering:
+            pond_pairs = pond_pairs.order_by(*ordering)
+        return [(pond_pair.pk, str(pond_pair)) for pond_pair in pond_pairs]
+
+
 @admin.register(DeviceStatus)
 class DeviceStatusAdmin(admin.ModelAdmin):
     list_display = ['pond_pair', 'status', 'last_seen', 'firmware_version', 'ip_address', 'is_online']
-    list_filter = ['status', 'firmware_version', 'pond_pair']
+    list_select_related = ['pond_pair__owner']
+    list_filter = ['status', 'firmware_version', ('pond_pair', PondPairListFilter)]
     search_fields = ['pond_pair__name', 'pond_pair__device_id', 'device_name']
     readonly_fields = ['created_at', 'updated_at', 'is_online']
     
@@ -40,7 +52,8 @@ class DeviceStatusAdmin(admin.ModelAdmin):
 @admin.register(MQTTMessage)
 class MQTTMessageAdmin(admin.ModelAdmin):
     list_display = ['pond_pair', 'topic', 'message_type', 'success', 'payload_size', 'created_at']
-    list_filter = ['message_type', 'success', 'pond_pair', 'created_at']
+    list_select_related = ['pond_pair__owner']
+    list_filter = ['message_type', 'success', ('pond_pair', PondPairListFilter), 'created_at']
     search_fields = ['pond_pair__name', 'topic', 'message_id', 'correlation_id']
     readonly_fields = ['message_id', 'correlation_id', 'created_at']
     
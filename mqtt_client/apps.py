@@ -41,21 +41,10 @@ class MqttClientConfig(AppConfig):
                     # Get MQTT client instance
                     client = get_mqtt_client()
                     
-                    # Connect to broker
+                    # Connect to broker. The paho network loop started by connect()
+                    # handles reconnection with backoff, so nothing to supervise here.
                     if client.connect():
                         logger.info("Django MQTT client connected successfully for incoming messages")
-                        
-                        # Keep connection alive
-                        import time
-                        while True:
-                            if not client.is_connected:
-                                logger.warning("Django MQTT client disconnected, reconnecting...")
-                                if not client.connect():
-                                    logger.error("Failed to reconnect Django MQTT client")
-                                    time.sleep(30)  # Wait before retry
-                                    continue
-                            
-                            time.sleep(10)  # Check connection every 10 seconds
                     else:
                         logger.error("Failed to connect Django MQTT client")
                         
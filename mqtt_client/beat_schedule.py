@@ -7,13 +7,9 @@ This module configures periodic tasks for the MQTT bridge system.
 from celery.schedules import crontab
 
 # MQTT Bridge Task Schedule
+# Incoming MQTT messages are not polled from here: the listen_mqtt_incoming
+# command holds a Redis subscription and processes them as they arrive.
 mqtt_bridge_schedule = {
-    # Process incoming MQTT messages from Redis every 10 seconds
-    'process-mqtt-messages': {
-        'task': 'mqtt_client.tasks.process_mqtt_messages_from_redis',
-        'schedule': 10.0,  # Every 10 seconds
-    },
-    
     # Monitor bridge health every minute
     'monitor-bridge-health': {
         'task': 'mqtt_client.tasks.monitor_mqtt_bridge_health',
@@ -8,11 +8,16 @@ It handles:
 - Command status updates and acknowledgments
 """
 
-import json
+import atexit
 import logging
+import os
+import queue
+import threading
+import time
 from typing import Dict, Any, Optional
 from django.conf import settings
 from django.utils import timezone
+import orjson
 import redis
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,18 @@ COMMAND_STATUS_CHANNEL = 'command_status_updates'
 # Redis connection
 _redis_client = None
 
+# Batched publishing (enabled by MQTT_BRIDGE_BATCH_MS)
+MAX_PUBLISH_BATCH_SIZE = 500
+PUBLISH_QUEUED = 'queued'  # Logged in place of the subscriber count of a queued publish
+_publish_queue = None
+_publisher_pid = None
+_publisher_lock = threading.Lock()
+
+
+def _dumps(message: Dict[str, Any]) -> bytes:
+    """Serialize a pub/sub payload; redis publishes the bytes as-is"""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
 
 def get_redis_client():
     """Get or create Redis client instance"""
@@ -47,6 +64,96 @@ def get_redis_client():
     return _redis_client
 
 
+def _get_publish_queue() -> queue.Queue:
+    """Get the batch publish queue, starting its flusher thread in this process"""
+    global _publish_queue, _publisher_pid
+    pid = os.getpid()
+    if _publisher_pid != pid:
+        with _publisher_lock:
+            # A forked worker inherits the queue but not the thread, so start afresh
+            if _publisher_pid != pid:
+                _publish_queue = queue.Queue()
+                threading.Thread(
+                    target=_flush_publish_batches,
+                    args=(_publish_queue,),
+                    name='redis-batch-publisher',
+                    daemon=True
+                ).start()
+                _publisher_pid = pid
+    return _publish_queue
+
+
+def _send_batch(redis_client, messages) -> list:
+    """Publish (channel, payload) messages in one pipeline, returning their subscriber counts"""
+    with redis_client.pipeline(transaction=False) as pipe:
+        for channel, payload in messages:
+            pipe.publish(channel, payload)
+        return pipe.execute()
+
+
+def _flush_publish_batches(publish_queue: queue.Queue):
+    """Drain queued messages into Redis, one pipeline per MQTT_BRIDGE_BATCH_MS window"""
+    batch_window = getattr(settings, 'MQTT_BRIDGE_BATCH_MS', 0) / 1000
+    while True:
+        batch = [publish_queue.get()]
+        deadline = time.monotonic() + batch_window
+        while len(batch) < MAX_PUBLISH_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(publish_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        try:
+            _send_batch(get_redis_client(), batch)
+        except Exception as e:
+            # Pub/sub is at-most-once: a failed batch is dropped, not retried
+            logger.error(f"Error flushing batched Redis publishes, dropped {len(batch)} messages: {e}")
+
+
+@atexit.register
+def _flush_pending_publishes():
+    """Publish whatever this process still has queued when it exits"""
+    if _publish_queue is None or _publisher_pid != os.getpid():
+        return
+    
+    batch = []
+    while True:
+        try:
+            batch.append(_publish_queue.get_nowait())
+        except queue.Empty:
+            break
+    
+    if batch:
+        try:
+            _send_batch(get_redis_client(), batch)
+        except Exception as e:
+            logger.error(f"Error flushing batched Redis publishes at exit, dropped {len(batch)} messages: {e}")
+
+
+def _publish(redis_client, *messages) -> list:
+    """
+    Publish (channel, payload) messages to Redis in a single round trip.
+    
+    Returns the subscriber count of each message. When MQTT_BRIDGE_BATCH_MS is
+    set the messages are queued for the background publisher instead, and each
+    count is PUBLISH_QUEUED since subscribers are only known once the batch is
+    flushed.
+    """
+    if getattr(settings, 'MQTT_BRIDGE_BATCH_MS', 0) > 0:
+        publish_queue = _get_publish_queue()
+        for message in messages:
+            publish_queue.put(message)
+        return [PUBLISH_QUEUED] * len(messages)
+    
+    if len(messages) == 1:
+        channel, payload = messages[0]
+        return [redis_client.publish(channel, payload)]
+    return _send_batch(redis_client, messages)
+
+
 def publish_to_mqtt(command_id: str, device_id: str, topic: str, payload: Dict[str, Any], qos: int = 2) -> bool:
     """
     Publish a command to the MQTT outgoing Redis channel.
@@ -76,7 +183,7 @@ def publish_to_mqtt(command_id: str, device_id: str, topic: str, payload: Dict[s
         }
         
         # Publish to Redis channel
-        result = redis_client.publish(MQTT_OUTGOING_CHANNEL, json.dumps(message))
+        result = _publish(redis_client, (MQTT_OUTGOING_CHANNEL, _dumps(message)))[0]
         
         # Redis publish returns number of subscribers, not success/failure
         # A successful publish returns the number of subscribers (0 is valid)
@@ -117,7 +224,7 @@ def publish_mqtt_message(topic: str, payload: Dict[str, Any], device_id: str = N
         }
         
         # Publish to Redis channel
-        result = redis_client.publish(MQTT_INCOMING_CHANNEL, json.dumps(message))
+        result = _publish(redis_client, (MQTT_INCOMING_CHANNEL, _dumps(message)))[0]
         
         # Redis publish returns number of subscribers, not success/failure
         # A successful publish returns the number of subscribers (0 is valid)
@@ -147,9 +254,9 @@ def subscribe_to_mqtt_outgoing(callback):
         def message_handler(message):
             if message['type'] == 'message':
                 try:
-                    data = json.loads(message['data'].decode('utf-8'))
+                    data = orjson.loads(message['data'])
                     callback(data)
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"Invalid JSON in Redis message: {e}")
         
         pubsub.message_handler = message_handler
@@ -178,9 +285,9 @@ def subscribe_to_mqtt_incoming(callback):
         def message_handler(message):
             if message['type'] == 'message':
                 try:
-                    data = json.loads(message['data'].decode('utf-8'))
+                    data = orjson.loads(message['data'])
                     callback(data)
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"Invalid JSON in Redis message: {e}")
         
         pubsub.message_handler = message_handler
@@ -220,12 +327,16 @@ def publish_command_status_update(command_id: str, status: str, message: str = '
             'pond_name': pond_name
         }
         
-        # Publish to Redis channel
-        result = redis_client.publish(COMMAND_STATUS_CHANNEL, json.dumps(status_data))
+        payload = _dumps(status_data)
         
-        # Also publish to command-specific channel for SSE streams
+        # Publish to the Redis channel and the command-specific channel for
+        # SSE streams in a single round trip
         command_channel = f'command_status_{command_id}'
-        result2 = redis_client.publish(command_channel, json.dumps(status_data))
+        result, result2 = _publish(
+            redis_client,
+            (COMMAND_STATUS_CHANNEL, payload),
+            (command_channel, payload)
+        )
         
         logger.info(f"📢 Command status update published for {command_id}: {status} (subscribers: {result}, command-specific: {result2})")
         return True
@@ -258,7 +369,7 @@ def publish_device_status_update(device_id: str, device_status: dict) -> bool:
         
         # Publish to device channel (one channel per device/pond pair)
         channel = f'device_status_{device_id}'
-        result = redis_client.publish(channel, json.dumps(status_data))
+        result = _publish(redis_client, (channel, _dumps(status_data)))[0]
         
         logger.info(f"📡 Device status update published for device {device_id} (subscribers: {result})")
         return True
@@ -291,7 +402,7 @@ def publish_sensor_data_update(device_id: str, sensor_data: dict) -> bool:
         
         # Publish to device channel (one channel per device/pond pair)
         channel = f'sensor_data_{device_id}'
-        result = redis_client.publish(channel, json.dumps(data))
+        result = _publish(redis_client, (channel, _dumps(data)))[0]
         
         logger.info(f"📊 Sensor data update published for device {device_id} (subscribers: {result})")
         return True
@@ -332,7 +443,7 @@ def publish_unified_command_status_update(device_id: str, command_id: str, statu
         
         # Publish to device channel (one channel per device/pond pair)
         channel = f'command_status_{device_id}'
-        result = redis_client.publish(channel, json.dumps(status_data))
+        result = _publish(redis_client, (channel, _dumps(status_data)))[0]
         
         logger.info(f"📢 Unified command status update published for device {device_id}, command {command_id}: {status} (subscribers: {result})")
         return True
@@ -365,7 +476,7 @@ def publish_alert_notification(device_id: str, alert: dict) -> bool:
         
         # Publish to device channel (one channel per device/pond pair)
         channel = f'alerts_{device_id}'
-        result = redis_client.publish(channel, json.dumps(data))
+        result = _publish(redis_client, (channel, _dumps(data)))[0]
         
         logger.info(f"🚨 Alert notification published for device {device_id} (subscribers: {result})")
         return True
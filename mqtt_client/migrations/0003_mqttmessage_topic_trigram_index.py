@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+# Admin search on topic runs UPPER(topic::text) LIKE UPPER('%term%') on
+# PostgreSQL, so the trigram index is built on that same expression.
+CREATE_TOPIC_TRGM_INDEX = (
+    'CREATE INDEX IF NOT EXISTS mqtt_client_topic_upper_trgm '
+    'ON mqtt_client_mqttmessage USING gin ((UPPER(topic::text)) gin_trgm_ops)'
+)
+DROP_TOPIC_TRGM_INDEX = 'DROP INDEX IF EXISTS mqtt_client_topic_upper_trgm'
+
+
+def create_topic_trigram_index(apps, schema_editor):
+    """Add the trigram index on PostgreSQL; other backends have no pg_trgm"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(CREATE_TOPIC_TRGM_INDEX)
+
+
+def drop_topic_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_TOPIC_TRGM_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mqtt_client', '0002_delete_mqttconnection'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_topic_trigram_index, drop_topic_trigram_index),
+    ]
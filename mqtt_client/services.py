@@ -269,7 +269,7 @@ class MQTTService:
             
             commands = DeviceCommand.objects.filter(
                 pond=pond
-            ).order_by('-created_at')[:limit]
+            ).select_related('user').order_by('-created_at')[:limit]
             
             return [
                 {
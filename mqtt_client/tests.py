@@ -9,6 +9,9 @@ This module tests:
 """
 
 import json
+import os
+import queue
+import threading
 import time
 from unittest.mock import Mock, patch, MagicMock
 from django.test import TestCase, override_settings
@@ -18,6 +21,7 @@ from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 import uuid
 
+from . import bridge
 from .client import MQTTClient, MQTTConfig
 from .services import MQTTService
 from .models import DeviceStatus, MQTTMessage
@@ -770,3 +774,132 @@ class MQTTClientIntegrationTestCase(TestCase):
         ).first()
         self.assertIsNotNone(message)
         self.assertTrue(message.success)
+
+
+class FakeRedisPipeline:
+    """Records PUBLISH commands and hands them to the fake client on execute()"""
+    
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def publish(self, channel, payload):
+        self.commands.append((channel, payload))
+
+    def execute(self):
+        return self.redis_client.execute_batch(self.commands)
+
+
+class FakeRedis:
+    """Minimal Redis client for the bridge's publish paths"""
+    
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.published = []
+        self.batches = []
+        self.flushed = threading.Event()
+
+    def publish(self, channel, payload):
+        self.published.append(channel)
+        return 1
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+    def execute_batch(self, commands):
+        self.flushed.set()
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError('Redis unavailable')
+        self.batches.append([channel for channel, _ in commands])
+        return [1] * len(commands)
+
+
+class BridgeBatchPublishTest(TestCase):
+    """Test the Redis bridge's immediate and batched publishing"""
+    
+    def setUp(self):
+        self.reset_publisher()
+        self.addCleanup(self.reset_publisher)
+        self.redis = FakeRedis()
+        patcher = patch('mqtt_client.bridge.get_redis_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def reset_publisher(self):
+        bridge._publish_queue = None
+        bridge._publisher_pid = None
+
+    def wait_for_flush(self):
+        self.assertTrue(self.redis.flushed.wait(timeout=2), "Batch was never flushed")
+        self.redis.flushed.clear()
+
+    def test_publishes_immediately_without_batching(self):
+        """Messages go straight to Redis, and the command status pair shares a pipeline"""
+        self.assertIs(bridge.publish_device_status_update('DEV1', {'status': 'online'}), True)
+        self.assertIs(bridge.publish_command_status_update('cmd-1', 'SENT'), True)
+        
+        self.assertEqual(self.redis.published, ['device_status_DEV1'])
+        self.assertEqual(self.redis.batches, [['command_status_updates', 'command_status_cmd-1']])
+
+    @override_settings(MQTT_BRIDGE_BATCH_MS=200)
+    def test_queued_messages_flush_in_one_pipeline(self):
+        """Batched publishes succeed once queued and reach Redis together"""
+        self.assertIs(bridge.publish_device_status_update('DEV1', {'status': 'online'}), True)
+        self.assertIs(bridge.publish_sensor_data_update('DEV1', {'temperature': 25.0}), True)
+        self.assertIs(bridge.publish_command_status_update('cmd-1', 'SENT'), True)
+        self.assertEqual(self.redis.published, [])
+        
+        self.wait_for_flush()
+        
+        self.assertEqual(self.redis.batches, [[
+            'device_status_DEV1', 'sensor_data_DEV1', 'command_status_updates', 'command_status_cmd-1'
+        ]])
+
+    @override_settings(MQTT_BRIDGE_BATCH_MS=10)
+    def test_failed_flush_is_logged_and_publisher_keeps_running(self):
+        """A failed batch is dropped with an error, and later batches still go out"""
+        self.redis.failures = 1
+        
+        with patch('mqtt_client.bridge.logger') as mock_logger:
+            bridge.publish_alert_notification('DEV1', {'level': 'HIGH'})
+            self.wait_for_flush()
+            
+            bridge.publish_alert_notification('DEV1', {'level': 'LOW'})
+            self.wait_for_flush()
+        
+        error_messages = [call.args[0] for call in mock_logger.error.call_args_list]
+        self.assertEqual(len(error_messages), 1)
+        self.assertIn('dropped 1 messages', error_messages[0])
+        self.assertEqual(self.redis.batches, [['alerts_DEV1']])
+
+    @override_settings(MQTT_BRIDGE_BATCH_MS=10)
+    def test_forked_process_gets_its_own_queue(self):
+        """A new pid gets a fresh queue and flusher thread instead of the parent's"""
+        parent_queue = bridge._get_publish_queue()
+        self.assertIs(bridge._get_publish_queue(), parent_queue)
+        
+        child_pid = os.getpid() + 1
+        with patch('mqtt_client.bridge.os.getpid', return_value=child_pid):
+            child_queue = bridge._get_publish_queue()
+        
+        self.assertIsNot(child_queue, parent_queue)
+        self.assertEqual(bridge._publisher_pid, child_pid)
+
+    def test_exit_flushes_pending_messages(self):
+        """Messages still queued at exit are published in one final pipeline"""
+        bridge._publish_queue = queue.Queue()
+        bridge._publisher_pid = os.getpid()
+        bridge._publish_queue.put(('alerts_DEV1', b'{}'))
+        bridge._publish_queue.put(('device_status_DEV1', b'{}'))
+        
+        bridge._flush_pending_publishes()
+        
+        self.assertEqual(self.redis.batches, [['alerts_DEV1', 'device_status_DEV1']])
+        self.assertTrue(bridge._publish_queue.empty())
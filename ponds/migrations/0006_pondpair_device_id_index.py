@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ponds', '0005_allow_null_sensor_values'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pondpair',
+            index=models.Index(fields=['device_id'], name='ponds_pondp_device__f09365_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:07
+
+import django.core.validators
+from django.db import migrations, models
+
+
+SENSOR_DISTANCE_FIELDS = ('sensor_distance', 'sensor_distance2')
+
+
+def add_missing_sensor_distance_columns(apps, schema_editor):
+    """
+    Add the columns unless they already exist.
+
+    The fields were on the model before this migration existed, so some
+    deployed databases may have gained the columns outside of migrations.
+    """
+    SensorData = apps.get_model('ponds', 'SensorData')
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        existing_columns = {
+            column.name for column in
+            connection.introspection.get_table_description(cursor, SensorData._meta.db_table)
+        }
+    for field_name in SENSOR_DISTANCE_FIELDS:
+        field = SensorData._meta.get_field(field_name)
+        if field.column not in existing_columns:
+            schema_editor.add_field(SensorData, field)
+
+
+def remove_sensor_distance_columns(apps, schema_editor):
+    SensorData = apps.get_model('ponds', 'SensorData')
+    for field_name in SENSOR_DISTANCE_FIELDS:
+        schema_editor.remove_field(SensorData, SensorData._meta.get_field(field_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ponds', '0006_pondpair_device_id_index'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='sensordata',
+                    name='sensor_distance',
+                    field=models.FloatField(blank=True, help_text='Raw sensor distance reading in cm from device', null=True, validators=[django.core.validators.MinValueValidator(0)]),
+                ),
+                migrations.AddField(
+                    model_name='sensordata',
+                    name='sensor_distance2',
+                    field=models.FloatField(blank=True, help_text='Second raw sensor distance reading in cm from device', null=True, validators=[django.core.validators.MinValueValidator(0)]),
+                ),
+            ],
+        ),
+        migrations.RunPython(add_missing_sensor_distance_columns, remove_sensor_distance_columns),
+    ]
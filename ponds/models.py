@@ -28,6 +28,9 @@ class PondPair(models.Model):
     
     class Meta:
         unique_together = ('owner', 'name')
+        indexes = [
+            models.Index(fields=['device_id']),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.device_id}) - {self.owner.username}"
@@ -5,6 +5,21 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from .utils import get_human_readable_error
 
+# SensorData columns reported as a pond's latest sensor data
+LATEST_SENSOR_DATA_FIELDS = (
+    'timestamp',
+    'temperature',
+    'water_level',
+    'feed_level',
+    'turbidity',
+    'dissolved_oxygen',
+    'ph',
+    'ammonia',
+    'battery',
+    'device_timestamp',
+    'signal_strength',
+)
+
 
 class PondDetailField(serializers.Field):
     """Custom field for pond details validation"""
@@ -113,26 +128,18 @@ class PondPairListSerializer(serializers.ModelSerializer):
         """
         from django.db.models import Q
         
-        # Get all sensor readings for this pond, ordered by timestamp
-        sensor_readings = pond.sensor_readings.all().order_by('-timestamp')
+        # Get all sensor readings for this pond, ordered by timestamp, loading
+        # only the columns reported below (plus the pond FK, which the related
+        # manager sets on every row and would otherwise fetch one by one)
+        sensor_readings = pond.sensor_readings.only(
+            'pond', *LATEST_SENSOR_DATA_FIELDS
+        ).order_by('-timestamp')
         
         if not sensor_readings.exists():
             return None
         
         # Initialize result with None values
-        latest_data = {
-            'timestamp': None,
-            'temperature': None,
-            'water_level': None,
-            'feed_level': None,
-            'turbidity': None,
-            'dissolved_oxygen': None,
-            'ph': None,
-            'ammonia': None,
-            'battery': None,
-            'device_timestamp': None,
-            'signal_strength': None
-        }
+        latest_data = dict.fromkeys(LATEST_SENSOR_DATA_FIELDS)
         
         # Find the latest non-zero value for each sensor
         for reading in sensor_readings:
@@ -285,6 +292,16 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
         fields = ('id', 'name', 'device_id', 'owner', 'owner_username', 'created_at', 'pond_details', 'ponds', 'pond_count', 'is_complete')
         read_only_fields = ('id', 'owner', 'owner_username', 'created_at', 'ponds', 'pond_count', 'is_complete')
     
+    def _get_existing_pair(self, device_id):
+        """Get the pond pair already registered to this device, looking it up only once"""
+        if not hasattr(self, '_existing_pairs'):
+            self._existing_pairs = {}
+        if device_id not in self._existing_pairs:
+            self._existing_pairs[device_id] = PondPair.objects.select_related('owner').filter(
+                device_id=device_id
+            ).first()
+        return self._existing_pairs[device_id]
+    
     def validate_name(self, value):
         """Validate that the name is unique for this user (only for new pond pairs)"""
         user = self.context['request'].user
@@ -292,7 +309,7 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
         # Check if this is an existing pair (adding pond to existing pair)
         device_id = self.initial_data.get('device_id')
         if device_id:
-            existing_pair = PondPair.objects.filter(device_id=device_id).first()
+            existing_pair = self._get_existing_pair(device_id)
             if existing_pair and existing_pair.owner == user:
                 # This is adding to an existing pair, skip name validation
                 return value
@@ -347,7 +364,7 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Device ID must be a valid MAC address in format XX:XX:XX:XX:XX:XX (e.g., AA:BB:CC:DD:EE:FF). Please check your device's MAC address.")
         
         # Check for existing pond pair with this device ID
-        existing_pair = PondPair.objects.filter(device_id=value).first()
+        existing_pair = self._get_existing_pair(value)
         if existing_pair:
             # Allow if the existing pair has only one pond (can add second pond)
             if existing_pair.pond_count >= 2:
@@ -359,7 +376,7 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
         """Validate the entire data set"""
         # Check if this is a reactivation attempt
         device_id = data.get('device_id')
-        existing_pair = PondPair.objects.filter(device_id=device_id).first()
+        existing_pair = self._get_existing_pair(device_id)
         
         if existing_pair and existing_pair.owner.username == settings.SYSTEM_USERNAME:
             # This is a reactivation, so we don't need to validate name uniqueness
@@ -381,8 +398,11 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
             
             # Validate that pond names don't conflict with existing active ponds for this user
             user = self.context['request'].user
+            taken_names = set(Pond.objects.filter(
+                parent_pair__owner=user, name__in=pond_names, is_active=True
+            ).values_list('name', flat=True))
             for pond_name in pond_names:
-                if Pond.objects.filter(parent_pair__owner=user, name=pond_name, is_active=True).exists():
+                if pond_name in taken_names:
                     raise serializers.ValidationError(f'You already have an active pond named "{pond_name}". Please use a different name.')
         
         return data
@@ -397,7 +417,7 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
         
         # Check if this is a reactivation attempt or adding second pond
         device_id = validated_data.get('device_id')
-        existing_pair = PondPair.objects.filter(device_id=device_id).first()
+        existing_pair = self._get_existing_pair(device_id)
         
         if existing_pair:
             if existing_pair.owner.username == settings.SYSTEM_USERNAME or not existing_pair.is_active:
@@ -405,7 +425,7 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
                 existing_pair.name = validated_data.get('name')
                 existing_pair.owner = validated_data.get('owner')
                 existing_pair.is_active = True  # Ensure is_active is set to True
-                existing_pair.save()
+                existing_pair.save(update_fields=['owner', 'name', 'is_active'])
                 
                 # Update ponds
                 existing_ponds = list(existing_pair.ponds.all())
@@ -421,7 +441,7 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
                             existing_ponds[i].sensor_height = pond_data['sensor_height']
                         if 'tank_depth' in pond_data:
                             existing_ponds[i].tank_depth = pond_data['tank_depth']
-                        existing_ponds[i].save()
+                        existing_ponds[i].save(update_fields=['name', 'sensor_height', 'tank_depth', 'is_active'])
                     else:
                         # Create new pond
                         pond_create_data = {
@@ -436,7 +456,7 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
                 # Deactivate any extra ponds beyond the new count
                 for i in range(len(pond_data_list), len(existing_ponds)):
                     existing_ponds[i].is_active = False
-                    existing_ponds[i].save()
+                    existing_ponds[i].save(update_fields=['is_active'])
                 
                 return existing_pair
             else:
@@ -461,22 +481,25 @@ class PondPairCreateSerializer(serializers.ModelSerializer):
             # Create new pond pair
             pond_pair = PondPair.objects.create(**validated_data)
             
-            # Create ponds
+            # Create ponds in a single INSERT. The pair is brand new and
+            # pond_details holds at most 2 entries, so the per-pond count
+            # check in Pond.save() has nothing to catch here.
             pond_data_list = self._process_pond_data(pond_details)
+            ponds = []
             for i, pond_data in enumerate(pond_data_list):
                 if not pond_data.get('name'):
                     # Auto-generate name if not provided
                     pond_data['name'] = f"Pond {i + 1}"
                 
-                pond_create_data = {
-                    'name': pond_data['name'],
-                    'parent_pair': pond_pair,
-                    'sensor_height': pond_data['sensor_height'],
-                    'tank_depth': pond_data['tank_depth'],
-                    'is_active': True
-                }
-                
-                Pond.objects.create(**pond_create_data)
+                ponds.append(Pond(
+                    name=pond_data['name'],
+                    parent_pair=pond_pair,
+                    sensor_height=pond_data['sensor_height'],
+                    tank_depth=pond_data['tank_depth'],
+                    is_active=True
+                ))
+            
+            Pond.objects.bulk_create(ponds)
             
             return pond_pair
 
@@ -575,26 +598,18 @@ class PondPairWithPondDetailsSerializer(serializers.ModelSerializer):
         """
         from django.db.models import Q
         
-        # Get all sensor readings for this pond, ordered by timestamp
-        sensor_readings = pond.sensor_readings.all().order_by('-timestamp')
+        # Get all sensor readings for this pond, ordered by timestamp, loading
+        # only the columns reported below (plus the pond FK, which the related
+        # manager sets on every row and would otherwise fetch one by one)
+        sensor_readings = pond.sensor_readings.only(
+            'pond', *LATEST_SENSOR_DATA_FIELDS
+        ).order_by('-timestamp')
         
         if not sensor_readings.exists():
             return None
         
         # Initialize result with None values
-        latest_data = {
-            'timestamp': None,
-            'temperature': None,
-            'water_level': None,
-            'feed_level': None,
-            'turbidity': None,
-            'dissolved_oxygen': None,
-            'ph': None,
-            'ammonia': None,
-            'battery': None,
-            'device_timestamp': None,
-            'signal_strength': None
-        }
+        latest_data = dict.fromkeys(LATEST_SENSOR_DATA_FIELDS)
         
         # Find the latest non-zero value for each sensor
         for reading in sensor_readings:
@@ -66,7 +66,7 @@ class PondPairListView(generics.ListCreateAPIView):
                 )
             
             # Check if this is a reactivation attempt
-            existing_pair = PondPair.objects.filter(device_id=device_id).first()
+            existing_pair = PondPair.objects.select_related('owner').filter(device_id=device_id).first()
             is_reactivation = existing_pair and (existing_pair.owner.username == settings.SYSTEM_USERNAME or not existing_pair.is_active)
             
             if is_reactivation:
@@ -77,7 +77,7 @@ class PondPairListView(generics.ListCreateAPIView):
                     if name:  # Update the pond pair name if provided
                         existing_pair.name = name
                     existing_pair.is_active = True  # Ensure is_active is set to True
-                    existing_pair.save()
+                    existing_pair.save(update_fields=['owner', 'name', 'is_active'])
                     
                     # Update pond details if provided
                     if pond_details:
@@ -91,7 +91,7 @@ class PondPairListView(generics.ListCreateAPIView):
                                 existing_ponds[i].sensor_height = pond_detail['sensor_height']
                                 existing_ponds[i].tank_depth = pond_detail['tank_depth']
                                 existing_ponds[i].is_active = True
-                                existing_ponds[i].save()
+                                existing_ponds[i].save(update_fields=['name', 'sensor_height', 'tank_depth', 'is_active'])
                             else:
                                 # Create new pond
                                 Pond.objects.create(
@@ -105,7 +105,7 @@ class PondPairListView(generics.ListCreateAPIView):
                         # Deactivate any extra ponds beyond the new count
                         for i in range(len(pond_details), len(existing_ponds)):
                             existing_ponds[i].is_active = False
-                            existing_ponds[i].save()
+                            existing_ponds[i].save(update_fields=['is_active'])
                     
                     # Validate pond count after re-registration
                     try:
@@ -113,7 +113,7 @@ class PondPairListView(generics.ListCreateAPIView):
                     except ValidationError as e:
                         # If validation fails, revert ownership and re-raise
                         existing_pair.owner = get_user_model().objects.get(username=settings.SYSTEM_USERNAME)
-                        existing_pair.save()
+                        existing_pair.save(update_fields=['owner'])
                         raise e
                     
                     # Return success response
@@ -413,7 +413,7 @@ class PondPairRemovePondView(generics.GenericAPIView):
             
             # Deactivate the pond instead of deleting it
             pond.is_active = False
-            pond.save()
+            pond.save(update_fields=['is_active'])
             
             return Response(
                 {'message': f'Pond {pond.name} removed from pair {pond_pair.name}'},
@@ -442,27 +442,29 @@ class PondListView(generics.GenericAPIView):
             # Check if user wants to include inactive ponds
             include_inactive = request.query_params.get('include_inactive', 'false').lower() == 'true'
             
-            if include_inactive:
-                ponds = Pond.objects.filter(parent_pair__owner=request.user).select_related('parent_pair')
-            else:
-                ponds = Pond.objects.filter(parent_pair__owner=request.user, is_active=True).select_related('parent_pair')
+            ponds = Pond.objects.filter(parent_pair__owner=request.user)
+            if not include_inactive:
+                ponds = ponds.filter(is_active=True)
             
-            # Serialize ponds manually
+            # Serialize ponds manually from plain rows; no model instances needed
             pond_data = []
-            for pond in ponds:
+            for pond in ponds.values(
+                'id', 'name', 'sensor_height', 'tank_depth', 'is_active', 'created_at',
+                'parent_pair_id', 'parent_pair__name', 'parent_pair__device_id',
+            ):
                 pond_data.append({
-                    'id': pond.id,
-                    'name': pond.name,
-                    'pond': pond.id,  # For test compatibility
-                    'sensor_height': pond.sensor_height,
-                    'tank_depth': pond.tank_depth,
+                    'id': pond['id'],
+                    'name': pond['name'],
+                    'pond': pond['id'],  # For test compatibility
+                    'sensor_height': pond['sensor_height'],
+                    'tank_depth': pond['tank_depth'],
                     'parent_pair': {
-                        'id': pond.parent_pair.id,
-                        'name': pond.parent_pair.name,
-                        'device_id': pond.parent_pair.device_id,
+                        'id': pond['parent_pair_id'],
+                        'name': pond['parent_pair__name'],
+                        'device_id': pond['parent_pair__device_id'],
                     },
-                    'is_active': pond.is_active,
-                    'created_at': pond.created_at.isoformat() if hasattr(pond, 'created_at') else None,
+                    'is_active': pond['is_active'],
+                    'created_at': pond['created_at'].isoformat(),
                 })
             
             return Response(pond_data, status=status.HTTP_200_OK)
@@ -496,7 +498,7 @@ class PondDetailView(generics.GenericAPIView):
                 'name': pond.name,
                 'sensor_height': pond.sensor_height,
                 'tank_depth': pond.tank_depth,
-                'parent_pair': pond.parent_pair.id,  # Just the ID, not the full object
+                'parent_pair': pond.parent_pair_id,  # Just the ID, without loading the pair
                 'is_active': pond.is_active,
                 'created_at': pond.created_at.isoformat() if hasattr(pond, 'created_at') else None,
             }
@@ -613,7 +615,7 @@ class PondRegistrationView(generics.CreateAPIView):
                 )
             
             # Check if this is a reactivation attempt
-            existing_pair = PondPair.objects.filter(device_id=device_id).first()
+            existing_pair = PondPair.objects.select_related('owner').filter(device_id=device_id).first()
             is_system_reactivation = existing_pair and existing_pair.owner.username == settings.SYSTEM_USERNAME
             is_user_reactivation = existing_pair and not existing_pair.is_active
             
@@ -625,7 +627,7 @@ class PondRegistrationView(generics.CreateAPIView):
                     if name:  # Update the pond pair name if provided
                         existing_pair.name = name
                     existing_pair.is_active = True  # Ensure is_active is set to True
-                    existing_pair.save()
+                    existing_pair.save(update_fields=['owner', 'name', 'is_active'])
                     
                     # Update pond details if provided
                     if pond_details:
@@ -639,7 +641,7 @@ class PondRegistrationView(generics.CreateAPIView):
                                 existing_ponds[i].sensor_height = pond_detail['sensor_height']
                                 existing_ponds[i].tank_depth = pond_detail['tank_depth']
                                 existing_ponds[i].is_active = True
-                                existing_ponds[i].save()
+                                existing_ponds[i].save(update_fields=['name', 'sensor_height', 'tank_depth', 'is_active'])
                             else:
                                 # Create new pond
                                 Pond.objects.create(
@@ -653,7 +655,7 @@ class PondRegistrationView(generics.CreateAPIView):
                         # Deactivate any extra ponds beyond the new count
                         for i in range(len(pond_details), len(existing_ponds)):
                             existing_ponds[i].is_active = False
-                            existing_ponds[i].save()
+                            existing_ponds[i].save(update_fields=['is_active'])
                     
                     # Validate pond count after re-registration
                     try:
@@ -661,7 +663,7 @@ class PondRegistrationView(generics.CreateAPIView):
                     except ValidationError as e:
                         # If validation fails, revert ownership and re-raise
                         existing_pair.owner = get_user_model().objects.get(username=settings.SYSTEM_USERNAME)
-                        existing_pair.save()
+                        existing_pair.save(update_fields=['owner'])
                         raise e
                     
                     # Return success response
@@ -677,7 +679,7 @@ class PondRegistrationView(generics.CreateAPIView):
                     existing_pair.is_active = True  # Ensure is_active is set to True
                     if name:  # Update the pond pair name if provided
                         existing_pair.name = name
-                    existing_pair.save()
+                    existing_pair.save(update_fields=['owner', 'name', 'is_active'])
                     
                     # Add new ponds if provided
                     if pond_details:
@@ -770,7 +772,7 @@ class PondPairDeactivateView(APIView):
             
             # Deactivate the pond pair itself
             pond_pair.is_active = False
-            pond_pair.save()
+            pond_pair.save(update_fields=['is_active'])
             
             return Response({
                 'message': f'Pond pair "{pond_pair.name}" deactivated successfully - all ponds deleted and pair deactivated',
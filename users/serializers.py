@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.db.models import Q
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from ponds.models import Pond
@@ -20,23 +21,45 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ('id', 'username', 'email', 'first_name', 'last_name')
         read_only_fields = ('id',)
         
-    def validate_email(self, value):
+    def validate(self, attrs):
         """
-        Validate email is unique except for the current user
+        Validate changed usernames and emails are unique except for the
+        current user, checking both in a single query
         """
         user = self.instance
-        if User.objects.exclude(pk=user.pk).filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
+        lookups = Q()
+        if 'username' in attrs and attrs['username'] != user.username:
+            lookups |= Q(username=attrs['username'])
+        if 'email' in attrs and attrs['email'] != user.email:
+            lookups |= Q(email=attrs['email'])
         
-    def validate_username(self, value):
+        if lookups:
+            errors = {}
+            conflicts = User.objects.exclude(pk=user.pk).filter(lookups).values_list('username', 'email')
+            for username, email in conflicts:
+                if 'username' in attrs and username == attrs['username']:
+                    errors['username'] = "A user with this username already exists."
+                if 'email' in attrs and email == attrs['email']:
+                    errors['email'] = "A user with this email already exists."
+            if errors:
+                raise serializers.ValidationError(errors)
+        return attrs
+    
+    def update(self, instance, validated_data):
         """
-        Validate username is unique except for the current user
+        Save only the fields whose values changed, skipping the write
+        entirely when nothing did
         """
-        user = self.instance
-        if User.objects.exclude(pk=user.pk).filter(username=value).exists():
-            raise serializers.ValidationError("A user with this username already exists.")
-        return value
+        changed_fields = [
+            field for field, value in validated_data.items()
+            if getattr(instance, field) != value
+        ]
+        for field in changed_fields:
+            setattr(instance, field, validated_data[field])
+        
+        if changed_fields:
+            instance.save(update_fields=changed_fields)
+        return instance
 
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -146,7 +169,7 @@ class PondSerializer(serializers.ModelSerializer):
     class Meta:
         model = Pond
         fields = ('id', 'name', 'parent_pair', 'parent_pair_device_id', 'owner_username', 'sensor_height', 'tank_depth', 'created_at', 'is_active')
-        read_only_fields = ('id', 'owner_username', 'parent_pair_device_id', 'created_at')
+        read_only_fields = ('id', 'owner_username', 'parent_pair_device_id', 'created_at', 'is_active')
 
 
 class AutomationScheduleSerializer(serializers.ModelSerializer):
@@ -265,34 +265,41 @@ class UserValidationTest(TestCase):
 # ============================================================================
 
 from django.urls import reverse
-from rest_framework.test import APIClient
+from rest_framework.test import APITestCase
 from rest_framework import status
 from ponds.models import Pond, PondPair
 
+# Resolved once at import rather than in every setUp/test
+REGISTER_URL = reverse('users:register')
+LOGIN_URL = reverse('users:login')
+LOGOUT_URL = reverse('users:logout')
+TOKEN_REFRESH_URL = reverse('users:token_refresh')
+POND_LIST_URL = reverse('users:pond_list')
+UPDATE_PROFILE_URL = reverse('users:update_profile')
 
-class RegisterViewTest(TestCase):
+
+class RegisterViewTest(APITestCase):
     """Tests for the user registration endpoint"""
     
+    # Shared across tests; tests that need variations work on a .copy()
+    valid_payload = {
+        'username': 'testuser',
+        'email': 'test@example.com',
+        'password': 'StrongPassword123!',
+        'password2': 'StrongPassword123!',
+        'first_name': 'Test',
+        'last_name': 'User'
+    }
+    
     def setUp(self):
-        self.client = APIClient()
-        self.register_url = reverse('users:register')
-        self.valid_payload = {
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'password': 'StrongPassword123!',
-            'password2': 'StrongPassword123!',
-            'first_name': 'Test',
-            'last_name': 'User'
-        }
+        self.register_url = REGISTER_URL
     
     def test_valid_registration(self):
         """Test that a user can register with valid credentials"""
         response = self.client.post(self.register_url, self.valid_payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(User.objects.filter(username='testuser').exists())
-        self.assertIn('user', response.data)
-        self.assertIn('refresh', response.data)
-        self.assertIn('access', response.data)
+        self.assertLessEqual({'user', 'refresh', 'access'}, response.data.keys())
     
     def test_invalid_password_mismatch(self):
         """Test that registration fails if passwords don't match"""
@@ -338,13 +345,12 @@ class RegisterViewTest(TestCase):
         self.assertIn('password', response.data)
 
 
-class CustomTokenObtainPairViewTest(TestCase):
+class CustomTokenObtainPairViewTest(APITestCase):
     """Tests for the custom token obtain pair view"""
     
     def setUp(self):
-        self.client = APIClient()
-        self.login_url = reverse('users:login')
-        self.logout_url = reverse('users:logout')
+        self.login_url = LOGIN_URL
+        self.logout_url = LOGOUT_URL
         
         # Create test user
         self.user = User.objects.create_user(
@@ -352,15 +358,14 @@ class CustomTokenObtainPairViewTest(TestCase):
             email='test@example.com',
             password='TestPassword123!'
         )
-        
-        # Login and get tokens
+    
+    def _login(self):
+        """Log in as the test user and return the issued token pair"""
         response = self.client.post(self.login_url, {
             'username': 'testuser',
             'password': 'TestPassword123!'
         }, format='json')
-        
-        self.access_token = response.data['access']
-        self.refresh_token = response.data['refresh']
+        return response.data['access'], response.data['refresh']
     
     def test_successful_login(self):
         """Test successful login with valid credentials"""
@@ -370,9 +375,7 @@ class CustomTokenObtainPairViewTest(TestCase):
         }, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('access', response.data)
-        self.assertIn('refresh', response.data)
-        self.assertIn('user', response.data)
+        self.assertLessEqual({'access', 'refresh', 'user'}, response.data.keys())
         
         # Check user data
         user_data = response.data['user']
@@ -404,13 +407,14 @@ class CustomTokenObtainPairViewTest(TestCase):
         response = self.client.post(self.login_url, {}, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('username', response.data)
-        self.assertIn('password', response.data)
+        self.assertLessEqual({'username', 'password'}, response.data.keys())
     
     def test_logout_success(self):
         """Test successful logout"""
+        access_token, _ = self._login()
+        
         # Set authentication header
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
         
         response = self.client.post(self.logout_url)
         
@@ -425,10 +429,11 @@ class CustomTokenObtainPairViewTest(TestCase):
     
     def test_token_refresh(self):
         """Test token refresh functionality"""
-        refresh_url = reverse('users:token_refresh')
+        refresh_url = TOKEN_REFRESH_URL
+        access_token, refresh_token = self._login()
         
         response = self.client.post(refresh_url, {
-            'refresh': self.refresh_token
+            'refresh': refresh_token
         }, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -436,11 +441,11 @@ class CustomTokenObtainPairViewTest(TestCase):
         
         # New access token should be different
         new_access_token = response.data['access']
-        self.assertNotEqual(new_access_token, self.access_token)
+        self.assertNotEqual(new_access_token, access_token)
     
     def test_token_refresh_invalid(self):
         """Test token refresh with invalid refresh token"""
-        refresh_url = reverse('users:token_refresh')
+        refresh_url = TOKEN_REFRESH_URL
         
         response = self.client.post(refresh_url, {
             'refresh': 'invalid_refresh_token'
@@ -456,12 +461,13 @@ class CustomTokenObtainPairViewTest(TestCase):
             device_id='AA:BB:CC:DD:EE:FF',
             owner=self.user
         )
+        access_token, _ = self._login()
         
         # Set authentication header
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
         
         # Try to access a protected endpoint (pond list)
-        url = reverse('users:pond_list')
+        url = POND_LIST_URL
         response = self.client.get(url)
         
         # Should succeed with valid token
@@ -470,7 +476,7 @@ class CustomTokenObtainPairViewTest(TestCase):
     def test_protected_endpoint_no_token(self):
         """Test access to protected endpoints without token"""
         # Try to access a protected endpoint without token
-        url = reverse('users:pond_list')
+        url = POND_LIST_URL
         response = self.client.get(url)
         
         # Should fail without token
@@ -482,7 +488,7 @@ class CustomTokenObtainPairViewTest(TestCase):
         self.client.credentials(HTTP_AUTHORIZATION='Bearer invalid_token')
         
         # Try to access a protected endpoint
-        url = reverse('users:pond_list')
+        url = POND_LIST_URL
         response = self.client.get(url)
         
         # Should fail with invalid token
@@ -492,68 +498,47 @@ class CustomTokenObtainPairViewTest(TestCase):
 # PROFILE TESTS (moved from old testing)
 # ============================================================================
 
-class UpdateProfileViewTest(TestCase):
+class UpdateProfileViewTest(APITestCase):
     """Tests for profile update endpoint"""
     
-    def setUp(self):
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
         # Create test user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='TestPassword123!'
         )
         
-        # Login and get token
-        response = self.client.post(reverse('users:login'), {
-            'username': 'testuser',
-            'password': 'TestPassword123!'
-        }, format='json')
-        
-        self.access_token = response.data['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
-        
-        # URLs
-        self.update_profile_url = reverse('users:update_profile')
-        
         # Create another user for uniqueness tests
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username='otheruser',
             email='other@example.com',
             password='OtherPassword123!'
         )
     
-    def test_update_profile_name(self):
-        """Test successful profile name update"""
-        data = {
-            'first_name': 'Updated',
-            'last_name': 'Name'
-        }
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['user']['first_name'], 'Updated')
-        self.assertEqual(response.data['user']['last_name'], 'Name')
-    
-    def test_update_email(self):
-        """Test updating email address"""
-        data = {'email': 'updated@example.com'}
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['user']['email'], 'updated@example.com')
-    
-    def test_update_username(self):
-        """Test updating username"""
-        data = {'username': 'newusername'}
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
         
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['user']['username'], 'newusername')
+        # URLs
+        self.update_profile_url = UPDATE_PROFILE_URL
+    
+    def test_update_valid_payloads(self):
+        """Test successful updates of name, email, username and special characters"""
+        payloads = [
+            {'first_name': 'Updated', 'last_name': 'Name'},
+            {'email': 'updated@example.com'},
+            {'username': 'newusername'},
+            {'first_name': 'José-María', 'last_name': 'O\'Connor'},
+        ]
+        
+        for data in payloads:
+            with self.subTest(data=data):
+                response = self.client.put(self.update_profile_url, data, format='json')
+                
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                for field, value in data.items():
+                    self.assertEqual(response.data['user'][field], value)
     
     def test_update_multiple_fields(self):
         """Test updating multiple profile fields at once"""
@@ -572,54 +557,25 @@ class UpdateProfileViewTest(TestCase):
         self.assertEqual(response.data['user']['first_name'], 'Updated')
         self.assertEqual(response.data['user']['last_name'], 'User')
     
-    def test_update_with_special_characters(self):
-        """Test updating with special characters in fields"""
-        data = {
-            'first_name': 'José-María',
-            'last_name': 'O\'Connor'
-        }
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['user']['first_name'], 'José-María')
-        self.assertEqual(response.data['user']['last_name'], 'O\'Connor')
-    
-    def test_update_username_duplicate(self):
-        """Test that updating to duplicate username fails"""
-        # Create another user with the username we want to use
-        User.objects.create_user(
-            username='duplicateuser',
-            email='duplicate@example.com',
-            password='DuplicatePass123!'
-        )
-        
-        data = {'username': 'duplicateuser'}
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('username', response.data)
-    
-    def test_update_email_duplicate(self):
-        """Test that updating to duplicate email fails"""
-        # Create another user with the email we want to use
-        User.objects.create_user(
-            username='duplicateuser',
-            email='duplicate@example.com',
-            password='DuplicatePass123!'
-        )
-        
-        data = {'email': 'duplicate@example.com'}
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('email', response.data)
+    def test_update_invalid_payloads(self):
+        """Test that duplicate and malformed profile updates fail"""
+        payloads = [
+            ({'username': 'otheruser'}, 'username'),
+            ({'email': 'other@example.com'}, 'email'),
+            ({'email': 'invalid-email'}, 'email'),
+            ({'username': ''}, 'username'),
+        ]
+        
+        for data, field in payloads:
+            with self.subTest(data=data):
+                response = self.client.put(self.update_profile_url, data, format='json')
+                
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(field, response.data)
     
     def test_update_profile_unauthenticated(self):
         """Test that unauthenticated user cannot update profile"""
-        self.client.credentials()  # Clear credentials
+        self.client.force_authenticate(user=None)
         
         data = {'first_name': 'Updated'}
         
@@ -641,24 +597,6 @@ class UpdateProfileViewTest(TestCase):
         self.assertEqual(response.data['user']['last_name'], '')
         self.assertEqual(response.data['user']['email'], 'test@example.com')
     
-    def test_update_profile_validation(self):
-        """Test profile update validation"""
-        # Test with invalid email format
-        data = {'email': 'invalid-email'}
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('email', response.data)
-        
-        # Test with empty username
-        data = {'username': ''}
-        
-        response = self.client.put(self.update_profile_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('username', response.data)
-    
     def test_get_profile(self):
         """Test getting user profile"""
         response = self.client.get(self.update_profile_url)
@@ -671,7 +609,7 @@ class UpdateProfileViewTest(TestCase):
     
     def test_get_profile_unauthenticated(self):
         """Test that unauthenticated user cannot get profile"""
-        self.client.credentials()  # Clear credentials
+        self.client.force_authenticate(user=None)
         
         response = self.client.get(self.update_profile_url)
         
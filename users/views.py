@@ -1,6 +1,7 @@
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.db import transaction
+from django.db.models import Count
 from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -9,13 +10,14 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from .serializers import (
     UserSerializer, RegisterSerializer, PondSerializer, 
     PondRegistrationSerializer, PondPairRegistrationSerializer
 )
 from django.shortcuts import get_object_or_404
 from django.conf import settings
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import AuthenticationFailed
 from ponds.models import Pond, PondPair
 
 User = get_user_model()
@@ -49,64 +51,53 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     """
     def post(self, request, *args, **kwargs):
         # Handle email/username authentication
-        username_or_email = request.data.get('username')
-        password = request.data.get('password')
+        data = request.data
+        username_or_email = data.get('username')
         
-        if username_or_email and password:
-            try:
-                # Determine if input is email or username
-                if '@' in username_or_email:
-                    # It's an email, find user by email
-                    user = User.objects.get(email=username_or_email)
-                    # Update request data to use actual username for JWT authentication
-                    request.data['username'] = user.username
-                else:
-                    # It's a username, use as is
-                    user = User.objects.get(username=username_or_email)
-                
-                # Verify password
-                if not user.check_password(password):
-                    return Response(
-                        {'error': 'Invalid credentials'}, 
-                        status=status.HTTP_401_UNAUTHORIZED
-                    )
-                
-            except User.DoesNotExist:
+        if username_or_email and '@' in username_or_email:
+            # It's an email, resolve the actual username for JWT authentication
+            username = User.objects.filter(
+                email=username_or_email
+            ).values_list('username', flat=True).first()
+            
+            if username is None:
                 return Response(
                     {'error': 'Invalid credentials'}, 
                     status=status.HTTP_401_UNAUTHORIZED
                 )
+            # Only email logins need a rewritten copy of the request data
+            data = data.copy()
+            data['username'] = username
+        
+        # Authenticate once through the JWT serializer, which also enforces
+        # the active-user rule and keeps hold of the authenticated user
+        serializer = self.get_serializer(data=data)
         
-        # Proceed with normal JWT authentication
-        response = super().post(request, *args, **kwargs)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+        except AuthenticationFailed:
+            return Response(
+                {'error': 'Invalid credentials'}, 
+                status=status.HTTP_401_UNAUTHORIZED
+            )
         
-        if response.status_code == 200:
-            try:
-                # Get the user from the token
-                username = request.data.get('username')
-                user = User.objects.get(username=username)
-                
-                response.data['user'] = UserSerializer(user).data
-                
-                # Add pond pairs information if available
-                pond_pairs = user.pond_pairs.all()
-                if pond_pairs.exists():
-                    response.data['has_pond_pairs'] = True
-                    response.data['pond_pairs_count'] = pond_pairs.count()
-                    # Count total ponds across all pairs
-                    total_ponds = sum(pair.pond_count for pair in pond_pairs)
-                    response.data['total_ponds_count'] = total_ponds
-                else:
-                    response.data['has_pond_pairs'] = False
-                    response.data['pond_pairs_count'] = 0
-                    response.data['total_ponds_count'] = 0
-                    
-            except User.DoesNotExist:
-                # User not found, but token was generated successfully
-                # This shouldn't happen in normal flow, but handle gracefully
-                pass
-                
-        return response
+        user = serializer.user
+        counts = PondPair.objects.filter(owner=user).aggregate(
+            pond_pairs_count=Count('id', distinct=True),
+            total_ponds_count=Count('ponds'),
+        )
+        
+        response_data = dict(serializer.validated_data)
+        response_data['user'] = UserSerializer(user).data
+        
+        # Add pond pairs information
+        response_data['has_pond_pairs'] = counts['pond_pairs_count'] > 0
+        response_data['pond_pairs_count'] = counts['pond_pairs_count']
+        response_data['total_ponds_count'] = counts['total_ponds_count']
+        
+        return Response(response_data, status=status.HTTP_200_OK)
 
 
 class UserProfileView(APIView):
@@ -180,7 +171,7 @@ class ChangePasswordView(APIView):
         
         # Set new password
         request.user.set_password(new_password)
-        request.user.save()
+        request.user.save(update_fields=['password'])
         
         return Response({
             'message': 'Password changed successfully'
@@ -246,11 +237,10 @@ class PondDetailView(APIView):
     permission_classes = [IsAuthenticated]
     
     def get_pond(self, pk, user):
-        """Helper method to get pond and verify ownership"""
-        pond = get_object_or_404(Pond, pk=pk)
-        if pond.parent_pair.owner != user:
-            raise PermissionDenied("You don't have permission to access this pond")
-        return pond
+        """Helper method to get a pond owned by the user"""
+        return get_object_or_404(
+            Pond.objects.select_related('parent_pair__owner'), pk=pk, parent_pair__owner=user
+        )
     
     def get(self, request, pk):
         """Retrieve pond details"""
@@ -262,12 +252,6 @@ class PondDetailView(APIView):
         """Update pond information"""
         pond = self.get_pond(pk, request.user)
         
-        # Remove is_active from request data to prevent direct modification
-        if 'is_active' in request.data:
-            mutable_data = request.data.copy()
-            mutable_data.pop('is_active')
-            request._full_data = mutable_data
-        
         # Check if name is being updated and would create a duplicate
         new_name = request.data.get('name')
         if new_name and new_name != pond.name:
@@ -294,11 +278,11 @@ class PondDetailView(APIView):
             
             # Transfer ownership to system user
             pond.parent_pair.owner = system_user
-            pond.parent_pair.save()
+            pond.parent_pair.save(update_fields=['owner'])
             
             # Deactivate the pond
             pond.is_active = False
-            pond.save()
+            pond.save(update_fields=['is_active'])
             
             return Response({
                 'message': 'Pond deleted successfully',
@@ -320,9 +304,15 @@ class PondListView(APIView):
     
     def get(self, request):
         """Get all ponds owned by the user"""
+        # Join the owner too: the serializer reports owner.username per pond.
+        # Only the pair's device ID and the owner's username are read from
+        # the joined rows, so leave their other columns out of the SELECT.
         ponds = Pond.objects.filter(
             parent_pair__owner=request.user
-        ).select_related('parent_pair')
+        ).select_related('parent_pair__owner').only(
+            'id', 'name', 'parent_pair', 'sensor_height', 'tank_depth', 'created_at', 'is_active',
+            'parent_pair__device_id', 'parent_pair__owner__username'
+        )
         
         serializer = PondSerializer(ponds, many=True)
         return Response(serializer.data)